@@ -1,8 +1,7 @@
 import logging
 import random
 import threading
-import time
-from typing import List, Iterator
+from typing import Dict, List, Iterator, Optional
 
 from .alarm import Alarm
 from .server import Server, get_zone_state_event_type
@@ -22,7 +21,7 @@ class AlarmServer:
         self._server = Server(handle_command=self._handle_command)
         self._host = host
         self._port = port
-        self._simulation_running = False
+        self._stop_simulation_event: Optional[threading.Event] = None
 
     def start(self) -> None:
         self._server.start(host=self._host, port=self._port)
@@ -36,16 +35,8 @@ class AlarmServer:
             command = command.upper().strip()
             if command == "D":
                 self._alarm.disarm()
-            elif command == "A" or command == "AA":
-                self._alarm.arm(Alarm.ArmingMode.ARMED_AWAY)
-            elif command == "AH":
-                self._alarm.arm(Alarm.ArmingMode.ARMED_HOME)
-            elif command == "AD":
-                self._alarm.arm(Alarm.ArmingMode.ARMED_DAY)
-            elif command == "AN":
-                self._alarm.arm(Alarm.ArmingMode.ARMED_NIGHT)
-            elif command == "AV":
-                self._alarm.arm(Alarm.ArmingMode.ARMED_VACATION)
+            elif command in CONSOLE_ARM_COMMANDS_MAP:
+                self._alarm.arm(CONSOLE_ARM_COMMANDS_MAP[command])
             elif command == "T":
                 self._alarm.trip()
 
@@ -80,10 +71,8 @@ class AlarmServer:
 
     def _handle_command(self, command: str) -> None:
         _LOGGER.info("Incoming User Command: {}".format(command))
-        if command == "AE" or command == "A1234E":
-            self._alarm.arm()
-        elif command == "HE" or command == "H1234E":
-            self._alarm.arm(Alarm.ArmingMode.ARMED_HOME)
+        if command in USER_ARM_COMMANDS_MAP:
+            self._alarm.arm(USER_ARM_COMMANDS_MAP[command])
         elif command == "1234E":
             self._alarm.disarm()
         elif command == "S00":
@@ -112,35 +101,64 @@ class AlarmServer:
         )
         self._server.write_event(event)
 
-    def _simulate_zone_events(self) -> None:
-        while self._simulation_running:
+    def _simulate_zone_events(self, stop_event: threading.Event) -> None:
+        while not stop_event.is_set():
             zone: Zone = random.choice(self._alarm.zones)
             self._alarm.update_zone(zone.id, toggled_state(zone.state))
             _LOGGER.info("Toggled zone: %s", zone)
-            time.sleep(random.randint(1, 5))
+            if stop_event.wait(random.randint(1, 5)):
+                break
 
     def _stop_simulation(self) -> None:
-        self._simulation_running = False
+        if self._stop_simulation_event is not None:
+            self._stop_simulation_event.set()
+            self._stop_simulation_event = None
 
     def _start_simulation(self) -> None:
-        if not self._simulation_running:
-            self._simulation_running = True
-            threading.Thread(target=self._simulate_zone_events).start()
+        if self._stop_simulation_event is None:
+            self._stop_simulation_event = threading.Event()
+            threading.Thread(
+                target=self._simulate_zone_events,
+                args=(self._stop_simulation_event,),
+                daemon=True,
+            ).start()
+
+
+CONSOLE_ARM_COMMANDS_MAP = {
+    "A": Alarm.ArmingMode.ARMED_AWAY,
+    "AA": Alarm.ArmingMode.ARMED_AWAY,
+    "AH": Alarm.ArmingMode.ARMED_HOME,
+    "AD": Alarm.ArmingMode.ARMED_DAY,
+    "AN": Alarm.ArmingMode.ARMED_NIGHT,
+    "AV": Alarm.ArmingMode.ARMED_VACATION,
+}
+
+USER_ARM_COMMANDS_MAP = {
+    "AE": Alarm.ArmingMode.ARMED_AWAY,
+    "A1234E": Alarm.ArmingMode.ARMED_AWAY,
+    "HE": Alarm.ArmingMode.ARMED_HOME,
+    "H1234E": Alarm.ArmingMode.ARMED_HOME,
+}
+
+MODE_TO_EVENT_MAP: Dict[Optional[Alarm.ArmingMode], SystemStatusEvent.EventType] = {
+    Alarm.ArmingMode.ARMED_AWAY: SystemStatusEvent.EventType.ARMED_AWAY,
+    Alarm.ArmingMode.ARMED_HOME: SystemStatusEvent.EventType.ARMED_HOME,
+    Alarm.ArmingMode.ARMED_DAY: SystemStatusEvent.EventType.ARMED_DAY,
+    Alarm.ArmingMode.ARMED_NIGHT: SystemStatusEvent.EventType.ARMED_NIGHT,
+    Alarm.ArmingMode.ARMED_VACATION: SystemStatusEvent.EventType.ARMED_VACATION,
+}
+
+TOGGLED_STATE_MAP = {
+    Zone.State.SEALED: Zone.State.UNSEALED,
+    Zone.State.UNSEALED: Zone.State.SEALED,
+}
 
 
 def mode_to_event(mode: Alarm.ArmingMode | None) -> SystemStatusEvent.EventType:
-    if mode == Alarm.ArmingMode.ARMED_AWAY:
-        return SystemStatusEvent.EventType.ARMED_AWAY
-    elif mode == Alarm.ArmingMode.ARMED_HOME:
-        return SystemStatusEvent.EventType.ARMED_HOME
-    elif mode == Alarm.ArmingMode.ARMED_DAY:
-        return SystemStatusEvent.EventType.ARMED_DAY
-    elif mode == Alarm.ArmingMode.ARMED_NIGHT:
-        return SystemStatusEvent.EventType.ARMED_NIGHT
-    elif mode == Alarm.ArmingMode.ARMED_VACATION:
-        return SystemStatusEvent.EventType.ARMED_VACATION
-    else:
+    event_type = MODE_TO_EVENT_MAP.get(mode)
+    if event_type is None:
         raise AssertionError("Unknown alarm mode")
+    return event_type
 
 
 def get_events_for_state_update(
@@ -186,10 +204,10 @@ def get_arming_status(state: Alarm.ArmingState) -> List[ArmingUpdate.ArmingStatu
 
 
 def toggled_state(state: Zone.State) -> Zone.State:
-    if state == Zone.State.SEALED:
-        return Zone.State.UNSEALED
-    else:
-        return Zone.State.SEALED
+    toggled = TOGGLED_STATE_MAP.get(state)
+    if toggled is None:
+        raise AssertionError("Unknown zone state")
+    return toggled
 
 
 def get_zone_for_id(zone_id: int) -> ZoneUpdate.Zone:
@@ -66,9 +66,10 @@ class Server:
 
     def _write_to_all_clients(self, data: str) -> None:
         _LOGGER.debug("Writing message '%s' to all clients", data)
+        buf = memoryview(data.encode("utf-8") + b"\r\n")
         with self._clients_lock:
             for conn in self._clients:
-                conn.send(data.encode("utf-8") + b"\r\n")
+                conn.sendall(buf)
 
     def _handle_incoming_data(self, data: bytes) -> None:
         _LOGGER.debug("Received incoming data: %s", data)
@@ -83,10 +84,14 @@ class Server:
             raise NotImplementedError()
 
 
-def get_zone_state_event_type(state: Zone.State) -> SystemStatusEvent.EventType:
-    if state == Zone.State.SEALED:
-        return SystemStatusEvent.EventType.SEALED
-    if state == Zone.State.UNSEALED:
-        return SystemStatusEvent.EventType.UNSEALED
+ZONE_STATE_EVENT_TYPE_MAP = {
+    Zone.State.SEALED: SystemStatusEvent.EventType.SEALED,
+    Zone.State.UNSEALED: SystemStatusEvent.EventType.UNSEALED,
+}
+
 
-    raise NotImplementedError()
+def get_zone_state_event_type(state: Zone.State) -> SystemStatusEvent.EventType:
+    event_type = ZONE_STATE_EVENT_TYPE_MAP.get(state)
+    if event_type is None:
+        raise NotImplementedError()
+    return event_type
@@ -1,5 +1,4 @@
 import asyncio
-import datetime
 import logging
 from asyncio import sleep
 from typing import Optional, Callable
@@ -52,7 +51,7 @@ class Client:
         self._closed = False
         self._backoff = Backoff()
         self._connect_lock = asyncio.Lock()
-        self._last_recv: Optional[datetime.datetime] = None
+        self._last_recv: Optional[float] = None
         self._update_interval = update_interval
 
     async def arm_away(self, code: Optional[str] = None) -> None:
@@ -78,12 +77,8 @@ class Client:
     async def update(self) -> None:
         """Force update of alarm status and zones"""
         _LOGGER.debug("Requesting state update from server (S00, S14)")
-        await asyncio.gather(
-            # List unsealed Zones
-            self.send_command("S00"),
-            # Arming status update
-            self.send_command("S14"),
-        )
+        await self._ensure_connected()
+        await self._connection.write(_UPDATE_PAYLOAD)
 
     async def _connect(self) -> None:
         async with self._connect_lock:
@@ -99,24 +94,27 @@ class Client:
                     _LOGGER.warning("Failed to connect: %s", e)
                     await sleep(self._backoff.duration())
 
-                self._last_recv = datetime.datetime.now()
+                self._last_recv = asyncio.get_running_loop().time()
 
             self._backoff.reset()
 
+    async def _ensure_connected(self) -> None:
+        # Fast path: avoid taking the connect lock when the connection is up.
+        # _connect() re-checks both conditions under the lock.
+        if not self._connection.connected or self._should_reconnect():
+            await self._connect()
+
     async def send_command(self, command: str) -> None:
-        packet = Packet(
-            address=0x00,
-            seq=0x00,
-            command=CommandType.USER_INTERFACE,
-            data=command,
-            timestamp=None,
-        )
-        await self._connect()
-        payload = packet.encode() + "\r\n"
-        _LOGGER.debug("Sending payload: %s", repr(payload))
-        return await self._connection.write(payload.encode("ascii"))
+        await self._ensure_connected()
+        payload = _STATUS_COMMAND_PAYLOADS.get(command)
+        if payload is None:
+            payload = _encode_command(command)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Sending payload: %r", payload)
+        return await self._connection.write(payload)
 
     async def _recv_loop(self) -> None:
+        loop = asyncio.get_running_loop()
         while not self._closed:
             await self._connect()
 
@@ -126,14 +124,15 @@ class Client:
                     _LOGGER.debug("Received None data from connection.read()")
                     break
 
-                self._last_recv = datetime.datetime.now()
+                self._last_recv = loop.time()
                 try:
-                    decoded_data = data.decode("utf-8").strip()
+                    decoded_data = data.strip().decode("ascii")
                 except UnicodeDecodeError:
                     _LOGGER.warning("Failed to decode data", exc_info=True)
                     continue
 
-                _LOGGER.debug("Decoding data: '%s'", decoded_data)
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Decoding data: '%s'", decoded_data)
                 if len(decoded_data) > 0:
                     try:
                         pkt = Packet.decode(decoded_data)
@@ -148,11 +147,10 @@ class Client:
                     self.alarm.handle_event(event)
 
     def _should_reconnect(self) -> bool:
-        now = datetime.datetime.now()
         return (
             self._last_recv is not None
-            and self._last_recv
-            < now - datetime.timedelta(seconds=self._update_interval + 30)
+            and asyncio.get_running_loop().time() - self._last_recv
+            > self._update_interval + 30
         )
 
     async def _update_loop(self) -> None:
@@ -189,3 +187,27 @@ class Client:
     ) -> Callable[[BaseEvent], None]:
         self._on_event_received = f
         return f
+
+
+def _encode_command(command: str) -> bytes:
+    """Encode a user interface command into the bytes sent over the wire"""
+    packet = Packet(
+        address=0x00,
+        seq=0x00,
+        command=CommandType.USER_INTERFACE,
+        data=command,
+        timestamp=None,
+    )
+    return packet.encode().encode("ascii") + b"\r\n"
+
+
+# Pre-encoded payloads for the fixed status requests the client sends. Other
+# commands may carry a user code, so they are encoded on every call rather
+# than being retained in a cache.
+_STATUS_COMMAND_PAYLOADS = {
+    command: _encode_command(command) for command in ("S00", "S14")
+}
+
+# List unsealed Zones (S00) followed by an arming status update (S14), sent as
+# a single write.
+_UPDATE_PAYLOAD = _STATUS_COMMAND_PAYLOADS["S00"] + _STATUS_COMMAND_PAYLOADS["S14"]
@@ -1,5 +1,7 @@
 import asyncio
+import collections
 import logging
+import socket
 from abc import ABC, abstractmethod
 from typing import Optional
 import serial
@@ -33,58 +35,243 @@ class Connection(ABC):
         raise NotImplementedError()
 
 
+# Size of the preallocated receive buffer, and the minimum free space offered
+# to the transport for each read.
+RECV_BUFFER_SIZE = 4096
+MIN_READ_SIZE = 1024
+# Partial frames larger than this are discarded, matching the default
+# asyncio.StreamReader limit.
+MAX_FRAME_SIZE = 64 * 1024
+# Reading from the transport is paused while more than this many bytes of
+# frames are waiting to be read, and resumed once it drops to MAX_FRAME_SIZE.
+MAX_QUEUED_BYTES = 2 * MAX_FRAME_SIZE
+
+# TCP keepalive: seconds idle before probing, seconds between probes, and the
+# number of unanswered probes before the connection is dropped.
+KEEPALIVE_IDLE = 30
+KEEPALIVE_INTERVAL = 10
+KEEPALIVE_COUNT = 3
+
+
+class NessProtocol(asyncio.BufferedProtocol):
+    """
+    Protocol which splits the incoming byte stream into newline terminated
+    frames and provides write flow control for the connection.
+
+    Socket transports read directly into a preallocated buffer owned by the
+    protocol. Transports which only support `data_received` (such as
+    pyserial-asyncio) have their data copied into the same buffer.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray(RECV_BUFFER_SIZE)
+        # Unconsumed data is buffer[_start:_end]. Scanning for the frame
+        # delimiter resumes from _scan_pos so each byte is only searched once.
+        self._start = 0
+        self._end = 0
+        self._scan_pos = 0
+        # Set after an oversized partial frame is dropped: the rest of that
+        # line is discarded up to and including the next delimiter.
+        self._discarding = False
+        self._frames: asyncio.Queue[Optional[bytes]] = asyncio.Queue()
+        # Size of the frames waiting in _frames, counting one extra byte per
+        # frame so a flood of empty frames is also limited
+        self._queued_bytes = 0
+        self._transport: Optional[asyncio.Transport] = None
+        self._reading_paused = False
+        self._paused = False
+        self._drain_waiters: collections.deque[asyncio.Future[None]] = (
+            collections.deque()
+        )
+        self._connection_lost = False
+        self._closed: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        # Commands are short and latency sensitive: only consider a write
+        # drained once it has been handed to the OS.
+        assert isinstance(transport, asyncio.Transport)
+        transport.set_write_buffer_limits(high=0)
+        self._transport = transport
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        self._reserve(max(sizehint, MIN_READ_SIZE))
+        return memoryview(self._buffer)[self._end :]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self._end += nbytes
+
+        buffer = self._buffer
+        start = self._start
+        with memoryview(buffer) as view:
+            while True:
+                idx = buffer.find(b"\n", self._scan_pos, self._end)
+                if idx == -1:
+                    self._scan_pos = self._end
+                    break
+
+                if self._discarding:
+                    self._discarding = False
+                    start = self._scan_pos = idx + 1
+                    continue
+
+                # Frames are CRLF terminated, trim the CR as part of the slice
+                end = idx - 1 if idx > start and buffer[idx - 1] == 0x0D else idx
+                frame = bytes(view[start:end])
+                self._frames.put_nowait(frame)
+                self._queued_bytes += len(frame) + 1
+                start = self._scan_pos = idx + 1
+
+        if start == self._end:
+            # Everything was consumed, rewind without moving any data
+            start = self._end = self._scan_pos = 0
+        elif self._end - start > MAX_FRAME_SIZE:
+            _LOGGER.warning(
+                "Discarding %d bytes received without a frame delimiter",
+                self._end - start,
+            )
+            start = self._end = self._scan_pos = 0
+            self._discarding = True
+        self._start = start
+
+        if (
+            self._queued_bytes > MAX_QUEUED_BYTES
+            and self._transport is not None
+            and not self._reading_paused
+        ):
+            # Apply backpressure until the consumer catches up
+            self._reading_paused = True
+            self._transport.pause_reading()
+
+    def data_received(self, data: bytes) -> None:
+        nbytes = len(data)
+        self._reserve(nbytes)
+        self._buffer[self._end : self._end + nbytes] = data
+        self.buffer_updated(nbytes)
+
+    def _reserve(self, size: int) -> None:
+        """Ensure at least `size` bytes are free at the end of the buffer"""
+        if len(self._buffer) - self._end >= size:
+            return
+
+        # Move the pending partial frame to the front of the buffer
+        if self._start:
+            pending = self._end - self._start
+            self._buffer[:pending] = self._buffer[self._start : self._end]
+            self._scan_pos -= self._start
+            self._start = 0
+            self._end = pending
+
+        free = len(self._buffer) - self._end
+        if free < size:
+            self._buffer.extend(bytes(size - free))
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        if exc is not None:
+            _LOGGER.info(
+                "Got exception: %s. Most likely the other side has disconnected!",
+                exc,
+            )
+
+        self._connection_lost = True
+        self._frames.put_nowait(None)
+        self._wake_drain_waiters()
+        if not self._closed.done():
+            self._closed.set_result(None)
+
+    def pause_writing(self) -> None:
+        self._paused = True
+
+    def resume_writing(self) -> None:
+        self._paused = False
+        self._wake_drain_waiters()
+
+    async def read_frame(self) -> Optional[bytes]:
+        """Wait for the next frame, or None once the connection is lost"""
+        frame = await self._frames.get()
+        if frame is None:
+            return None
+
+        self._queued_bytes -= len(frame) + 1
+        if (
+            self._reading_paused
+            and self._queued_bytes <= MAX_FRAME_SIZE
+            and self._transport is not None
+            and not self._connection_lost
+        ):
+            self._reading_paused = False
+            self._transport.resume_reading()
+        return frame
+
+    async def drain(self) -> None:
+        if self._connection_lost:
+            raise ConnectionResetError("Connection lost")
+        if not self._paused:
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._drain_waiters.append(waiter)
+        try:
+            await waiter
+        finally:
+            self._drain_waiters.remove(waiter)
+
+        if self._connection_lost:
+            raise ConnectionResetError("Connection lost")
+
+    async def wait_closed(self) -> None:
+        await self._closed
+
+    def _wake_drain_waiters(self) -> None:
+        for waiter in self._drain_waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+
 class AsyncIoConnection(Connection, ABC):
     """A connection via IP232 with a Ness D8X/D16X server"""
 
     def __init__(self) -> None:
         super().__init__()
 
-        self._write_lock = asyncio.Lock()
-        self._reader: Optional[asyncio.StreamReader] = None
-        self._writer: Optional[asyncio.StreamWriter] = None
+        self._transport: Optional[asyncio.Transport] = None
+        self._protocol: Optional[NessProtocol] = None
 
     @property
     def connected(self) -> bool:
-        return self._reader is not None and self._writer is not None
+        # The transport and protocol are always set and cleared together
+        return self._protocol is not None
 
     async def read(self) -> Optional[bytes]:
-        assert self._reader is not None
-
-        try:
-            data = await self._reader.readuntil(b"\n")
-        except (asyncio.IncompleteReadError, TimeoutError, ConnectionResetError) as e:
-            _LOGGER.info(
-                "Got exception: %s. Most likely the other side has " "disconnected!", e
-            )
-            self._writer = None
-            self._reader = None
-            return None
+        if self._protocol is None:
+            raise ConnectionError("Not connected")
 
+        data = await self._protocol.read_frame()
         if data is None:
-            _LOGGER.info("Empty response received")
-            self._writer = None
-            self._reader = None
+            _LOGGER.info("Connection closed")
+            self._transport = None
+            self._protocol = None
             return None
 
-        return data.strip()
+        # NessProtocol has already removed the CRLF terminator
+        return data
 
     async def write(self, data: bytes) -> None:
-        _LOGGER.debug("Waiting for write_lock to write data: %s", data)
-        async with self._write_lock:
-            _LOGGER.debug("Obtained write_lock to write data: %s", data)
-            assert self._writer is not None
+        if self._transport is None or self._protocol is None:
+            raise ConnectionError("Not connected")
 
-            self._writer.write(data)
-            await self._writer.drain()
-            _LOGGER.debug("Data was written: %s", data)
+        # Transport writes are synchronous and preserve ordering, and the
+        # protocol supports concurrent drain() callers, so no lock is needed.
+        self._transport.write(data)
+        await self._protocol.drain()
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Data was written: %r", data)
 
     async def close(self) -> None:
-        if self.connected and self._writer is not None:
-            self._writer.close()
-            if hasattr(self._writer, "wait_closed"):
-                await self._writer.wait_closed()
-            self._writer = None
-            self._reader = None
+        if self._transport is not None and self._protocol is not None:
+            self._transport.close()
+            await self._protocol.wait_closed()
+            self._transport = None
+            self._protocol = None
 
 
 class IP232Connection(AsyncIoConnection):
@@ -97,12 +284,34 @@ class IP232Connection(AsyncIoConnection):
         self._port = port
 
     async def connect(self) -> bool:
-        self._reader, self._writer = await asyncio.open_connection(
+        if self.connected:
+            return True
+
+        loop = asyncio.get_running_loop()
+        self._transport, self._protocol = await loop.create_connection(
+            NessProtocol,
             host=self._host,
             port=self._port,
         )
+        self._enable_keepalive(self._transport.get_extra_info("socket"))
         return True
 
+    @staticmethod
+    def _enable_keepalive(sock: socket.socket) -> None:
+        """
+        Enable TCP keepalive so a silently dropped connection is detected
+        within about a minute rather than the OS default of two hours.
+        """
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE)
+        if hasattr(socket, "TCP_KEEPINTVL"):
+            sock.setsockopt(
+                socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, KEEPALIVE_INTERVAL
+            )
+        if hasattr(socket, "TCP_KEEPCNT"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, KEEPALIVE_COUNT)
+
 
 class Serial232Connection(AsyncIoConnection):
     """A connection via Serial RS232 with a Ness D8X/D16X device or server"""
@@ -111,33 +320,29 @@ class Serial232Connection(AsyncIoConnection):
         super().__init__()
 
         self._tty_path = tty_path
-        self._serial_connection: Optional[serial.Serial] = None
-
-    @property
-    def connected(self) -> bool:
-        return (
-            super().connected
-            and self._serial_connection is not None
-            and self._serial_connection.isOpen()
-        )
 
     async def connect(self) -> bool:
-        loop = asyncio.get_event_loop()
-        self._reader = asyncio.StreamReader(loop=loop)
-        protocol_in = asyncio.StreamReaderProtocol(self._reader, loop=loop)
+        if self.connected:
+            return True
+
+        loop = asyncio.get_running_loop()
+        protocol = NessProtocol()
         transport: SerialTransport
 
         # Open the serial connection - always 9600 baud N-8-1
-        transport, protocol = await create_serial_connection(
+        transport, _ = await create_serial_connection(
             loop,
-            lambda: protocol_in,
+            lambda: protocol,
             self._tty_path,
             baudrate=9600,
             parity=serial.PARITY_NONE,
             bytesize=serial.EIGHTBITS,
             stopbits=serial.STOPBITS_ONE,
         )
-        self._serial_connection = transport.serial
-        self._writer = asyncio.StreamWriter(transport, protocol, self._reader, loop)
+        if not transport.serial.isOpen():
+            transport.close()
+            return False
 
-        return self._serial_connection.isOpen()
+        self._transport = transport
+        self._protocol = protocol
+        return True
@@ -1,50 +1,116 @@
 import datetime
-import struct
+import functools
 from enum import Enum
-from typing import List, Optional, TypeVar, Type
+from operator import or_
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar, Type
 
 from .packet import CommandType, Packet
 
 T = TypeVar("T", bound=Enum)
 
+_UNSET = object()
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+def _parse_hex(data: str, start: int, end: int) -> int:
+    """
+    Parse data[start:end] as an unsigned hex value. Unlike int(..., 16) this
+    rejects short fields, signs, whitespace and underscores.
+    """
+    field = data[start:end]
+    if len(field) != end - start or not _HEX_DIGITS.issuperset(field):
+        raise ValueError("Invalid hex data: {!r}".format(field))
+    return int(field, 16)
+
+
+@functools.lru_cache(maxsize=None)
+def _enum_bits(enum_type: Type[T]) -> Dict[int, Tuple[int, T]]:
+    """
+    Map each (single bit) value of a bitfield enum to its definition index
+    and member.
+    """
+    return {e.value: (i, e) for i, e in enumerate(enum_type)}
+
+
+@functools.lru_cache(maxsize=4096)
+def _decode_bits(enum_type: Type[T], raw_data: int) -> Tuple[T, ...]:
+    # Only visit the bits which are set, rather than testing every member
+    bits = _enum_bits(enum_type)
+    found = []
+    while raw_data:
+        bit = raw_data & -raw_data
+        raw_data ^= bit
+        entry = bits.get(bit)
+        if entry is not None:
+            found.append(entry)
+
+    # Members are returned in definition order
+    found.sort()
+    return tuple(member for _, member in found)
+
 
 def unpack_unsigned_short_data_enum(packet: Packet, enum_type: Type[T]) -> List[T]:
-    data = bytearray.fromhex(packet.data)
-    (raw_data,) = struct.unpack(">H", data[1:3])
-    return [e for e in enum_type if e.value & raw_data]
+    # The 16 bit big endian value following the request id (bytes 1-2)
+    raw_data = _parse_hex(packet.data, 2, 6)
+    if not 0 <= raw_data <= 0xFFFF:
+        # The set bit walk below only terminates for non-negative values
+        raise ValueError("{!r} is not a 16 bit value".format(raw_data))
+    if not raw_data:
+        return []
+    # Panels repeat the same few states, so the decoded members are cached.
+    # A new list is returned so callers are free to mutate it.
+    return list(_decode_bits(enum_type, raw_data))
+
+
+def _enum_member(members: Dict[int, T], value: int, enum_type: Type[T]) -> T:
+    try:
+        return members[value]
+    except KeyError:
+        raise ValueError(
+            "{!r} is not a valid {}".format(value, enum_type.__qualname__)
+        ) from None
 
 
 def pack_unsigned_short_data_enum(items: List[T]) -> str:
-    value = 0
-    for item in items:
-        value |= item.value
-
-    packed_value = struct.pack(">H", value)
-    return packed_value.hex()
+    value = functools.reduce(or_, (item.value for item in items), 0)
+    # Hex encoded 16 bit big endian value
+    return format(value, "04x")
 
 
 class BaseEvent(object):
+    __slots__ = ("address", "timestamp")
+
     def __init__(self, address: Optional[int], timestamp: Optional[datetime.datetime]):
         self.address = address
         self.timestamp = timestamp
 
     def __repr__(self) -> str:
-        return "<{} {}>".format(self.__class__.__name__, self.__dict__)
+        # Slots across the class hierarchy (base classes first). Unset slots are
+        # skipped so partially constructed events can still be printed.
+        fields = {}
+        for klass in reversed(type(self).__mro__):
+            for name in klass.__dict__.get("__slots__", ()):
+                value = getattr(self, name, _UNSET)
+                if value is not _UNSET:
+                    fields[name] = value
+        # Subclasses without __slots__ may also have instance attributes
+        fields.update(getattr(self, "__dict__", {}))
+        return f"<{type(self).__name__} {fields}>"
 
     @classmethod
     def decode(cls, packet: Packet) -> "BaseEvent":
-        if packet.command == CommandType.SYSTEM_STATUS:
-            return SystemStatusEvent.decode(packet)
-        elif packet.command == CommandType.USER_INTERFACE:
-            return StatusUpdate.decode(packet)
-        else:
+        decoder = _COMMAND_DECODER_MAP.get(packet.command)
+        if decoder is None:
             raise ValueError("Unknown command: {}".format(packet.command))
+        return decoder(packet)
 
     def encode(self) -> Packet:
         raise NotImplementedError()
 
 
 class SystemStatusEvent(BaseEvent):
+    __slots__ = ("type", "zone", "area")
+
     class EventType(Enum):
         # Zone/User Events
         UNSEALED = 0x00
@@ -95,18 +161,20 @@ class SystemStatusEvent(BaseEvent):
         address: Optional[int],
         timestamp: Optional[datetime.datetime],
     ) -> None:
-        super(SystemStatusEvent, self).__init__(address=address, timestamp=timestamp)
+        super().__init__(address=address, timestamp=timestamp)
         self.type = type
         self.zone = zone
         self.area = area
 
     @classmethod
     def decode(cls, packet: Packet) -> "SystemStatusEvent":
-        event_type = int(packet.data[0:2], 16)
+        value = _parse_hex(packet.data, 0, 6)
+        event_type = value >> 16
+        # The zone field is decoded as decimal digits, not hex
         zone = int(packet.data[2:4])
-        area = int(packet.data[4:6], 16)
+        area = value & 0xFF
         return SystemStatusEvent(
-            type=SystemStatusEvent.EventType(event_type),
+            type=_enum_member(_EVENT_TYPE_MAP, event_type, SystemStatusEvent.EventType),
             zone=zone,
             area=area,
             timestamp=packet.timestamp,
@@ -114,7 +182,7 @@ class SystemStatusEvent(BaseEvent):
         )
 
     def encode(self) -> Packet:
-        data = "{:02x}{:02x}{:02x}".format(self.type.value, self.zone, self.area)
+        data = "%02x%02x%02x" % (self.type.value, self.zone, self.area)
         return Packet(
             address=self.address,
             seq=0x00,
@@ -126,6 +194,8 @@ class SystemStatusEvent(BaseEvent):
 
 
 class StatusUpdate(BaseEvent):
+    __slots__ = ("request_id",)
+
     class RequestID(Enum):
         ZONE_INPUT_UNSEALED = 0x0
         ZONE_RADIO_UNSEALED = 0x1
@@ -153,31 +223,23 @@ class StatusUpdate(BaseEvent):
         address: Optional[int],
         timestamp: Optional[datetime.datetime],
     ) -> None:
-        super(StatusUpdate, self).__init__(address=address, timestamp=timestamp)
+        super().__init__(address=address, timestamp=timestamp)
         self.request_id = request_id
 
     @classmethod
     def decode(self, packet: Packet) -> "StatusUpdate":
-        request_id = StatusUpdate.RequestID(int(packet.data[0:2], 16))
-        if request_id.name.startswith("ZONE"):
-            return ZoneUpdate.decode(packet)
-        elif request_id == StatusUpdate.RequestID.MISCELLANEOUS_ALARMS:
-            return MiscellaneousAlarmsUpdate.decode(packet)
-        elif request_id == StatusUpdate.RequestID.ARMING:
-            return ArmingUpdate.decode(packet)
-        elif request_id == StatusUpdate.RequestID.OUTPUTS:
-            return OutputsUpdate.decode(packet)
-        elif request_id == StatusUpdate.RequestID.VIEW_STATE:
-            return ViewStateUpdate.decode(packet)
-        elif request_id == StatusUpdate.RequestID.PANEL_VERSION:
-            return PanelVersionUpdate.decode(packet)
-        elif request_id == StatusUpdate.RequestID.AUXILIARY_OUTPUTS:
-            return AuxiliaryOutputsUpdate.decode(packet)
-        else:
+        request_id = _enum_member(
+            _REQUEST_ID_MAP, int(packet.data[0:2], 16), StatusUpdate.RequestID
+        )
+        decoder = _REQUEST_ID_DECODER_MAP.get(request_id)
+        if decoder is None:
             raise ValueError("Unhandled request_id case: {}".format(request_id))
+        return decoder(packet)
 
 
 class ZoneUpdate(StatusUpdate):
+    __slots__ = ("included_zones",)
+
     class Zone(Enum):
         ZONE_1 = 0x0100
         ZONE_2 = 0x0200
@@ -203,14 +265,14 @@ class ZoneUpdate(StatusUpdate):
         address: Optional[int],
         timestamp: Optional[datetime.datetime],
     ) -> None:
-        super(ZoneUpdate, self).__init__(
-            request_id=request_id, address=address, timestamp=timestamp
-        )
+        super().__init__(request_id=request_id, address=address, timestamp=timestamp)
         self.included_zones = included_zones
 
     @classmethod
     def decode(cls, packet: Packet) -> "ZoneUpdate":
-        request_id = StatusUpdate.RequestID(int(packet.data[0:2], 16))
+        request_id = _enum_member(
+            _REQUEST_ID_MAP, int(packet.data[0:2], 16), StatusUpdate.RequestID
+        )
         return ZoneUpdate(
             request_id=request_id,
             included_zones=unpack_unsigned_short_data_enum(packet, ZoneUpdate.Zone),
@@ -219,9 +281,8 @@ class ZoneUpdate(StatusUpdate):
         )
 
     def encode(self) -> Packet:
-        data = "{:02x}{}".format(
-            self.request_id.value,
-            pack_unsigned_short_data_enum(self.included_zones),
+        data = _REQUEST_ID_HEX_MAP[self.request_id] + pack_unsigned_short_data_enum(
+            self.included_zones
         )
         return Packet(
             address=self.address,
@@ -234,6 +295,8 @@ class ZoneUpdate(StatusUpdate):
 
 
 class MiscellaneousAlarmsUpdate(StatusUpdate):
+    __slots__ = ("included_alarms",)
+
     class AlarmType(Enum):
         """
         Note: The ness provided documentation has the byte endianness
@@ -264,7 +327,7 @@ class MiscellaneousAlarmsUpdate(StatusUpdate):
         address: Optional[int],
         timestamp: Optional[datetime.datetime],
     ):
-        super(MiscellaneousAlarmsUpdate, self).__init__(
+        super().__init__(
             request_id=StatusUpdate.RequestID.MISCELLANEOUS_ALARMS,
             address=address,
             timestamp=timestamp,
@@ -284,6 +347,8 @@ class MiscellaneousAlarmsUpdate(StatusUpdate):
 
 
 class ArmingUpdate(StatusUpdate):
+    __slots__ = ("status",)
+
     class ArmingStatus(Enum):
         """
         Note: The ness provided documentation has the byte endianness
@@ -312,7 +377,7 @@ class ArmingUpdate(StatusUpdate):
         address: Optional[int],
         timestamp: Optional[datetime.datetime],
     ):
-        super(ArmingUpdate, self).__init__(
+        super().__init__(
             request_id=StatusUpdate.RequestID.ARMING,
             address=address,
             timestamp=timestamp,
@@ -329,9 +394,8 @@ class ArmingUpdate(StatusUpdate):
         )
 
     def encode(self) -> Packet:
-        data = "{:02x}{}".format(
-            self.request_id.value,
-            pack_unsigned_short_data_enum(self.status),
+        data = _REQUEST_ID_HEX_MAP[self.request_id] + pack_unsigned_short_data_enum(
+            self.status
         )
         return Packet(
             address=self.address,
@@ -344,6 +408,8 @@ class ArmingUpdate(StatusUpdate):
 
 
 class OutputsUpdate(StatusUpdate):
+    __slots__ = ("outputs",)
+
     class OutputType(Enum):
         """
         Note: The ness provided documentation has the byte endianness
@@ -377,7 +443,7 @@ class OutputsUpdate(StatusUpdate):
         address: Optional[int],
         timestamp: Optional[datetime.datetime],
     ):
-        super(OutputsUpdate, self).__init__(
+        super().__init__(
             request_id=StatusUpdate.RequestID.OUTPUTS,
             address=address,
             timestamp=timestamp,
@@ -394,6 +460,8 @@ class OutputsUpdate(StatusUpdate):
 
 
 class ViewStateUpdate(StatusUpdate):
+    __slots__ = ("state",)
+
     class State(Enum):
         NORMAL = 0xF000
         BRIEF_DAY_CHIME = 0xE000
@@ -410,7 +478,7 @@ class ViewStateUpdate(StatusUpdate):
         address: Optional[int],
         timestamp: Optional[datetime.datetime],
     ):
-        super(ViewStateUpdate, self).__init__(
+        super().__init__(
             request_id=StatusUpdate.RequestID.VIEW_STATE,
             address=address,
             timestamp=timestamp,
@@ -419,7 +487,9 @@ class ViewStateUpdate(StatusUpdate):
 
     @classmethod
     def decode(cls, packet: Packet) -> "ViewStateUpdate":
-        state = ViewStateUpdate.State(int(packet.data[2:6], 16))
+        state = _enum_member(
+            _VIEW_STATE_MAP, int(packet.data[2:6], 16), ViewStateUpdate.State
+        )
         return ViewStateUpdate(
             state=state,
             timestamp=packet.timestamp,
@@ -428,6 +498,8 @@ class ViewStateUpdate(StatusUpdate):
 
 
 class PanelVersionUpdate(StatusUpdate):
+    __slots__ = ("model", "major_version", "minor_version")
+
     class Model(Enum):
         D16X = 0x00
         D16X_3G = 0x04
@@ -441,7 +513,7 @@ class PanelVersionUpdate(StatusUpdate):
         address: Optional[int],
         timestamp: Optional[datetime.datetime],
     ):
-        super(PanelVersionUpdate, self).__init__(
+        super().__init__(
             request_id=StatusUpdate.RequestID.PANEL_VERSION,
             address=address,
             timestamp=timestamp,
@@ -456,9 +528,10 @@ class PanelVersionUpdate(StatusUpdate):
 
     @classmethod
     def decode(cls, packet: Packet) -> "PanelVersionUpdate":
-        model = PanelVersionUpdate.Model(int(packet.data[2:4], 16))
-        major_version = int(packet.data[4:5], 16)
-        minor_version = int(packet.data[5:6], 16)
+        value = _parse_hex(packet.data, 2, 6)
+        model = _enum_member(_MODEL_MAP, value >> 8, PanelVersionUpdate.Model)
+        major_version = (value >> 4) & 0xF
+        minor_version = value & 0xF
         return PanelVersionUpdate(
             model=model,
             minor_version=minor_version,
@@ -469,6 +542,8 @@ class PanelVersionUpdate(StatusUpdate):
 
 
 class AuxiliaryOutputsUpdate(StatusUpdate):
+    __slots__ = ("outputs",)
+
     class OutputType(Enum):
         AUX_1 = 0x0001
         AUX_2 = 0x0002
@@ -485,7 +560,7 @@ class AuxiliaryOutputsUpdate(StatusUpdate):
         address: Optional[int],
         timestamp: Optional[datetime.datetime],
     ):
-        super(AuxiliaryOutputsUpdate, self).__init__(
+        super().__init__(
             request_id=StatusUpdate.RequestID.AUXILIARY_OUTPUTS,
             address=address,
             timestamp=timestamp,
@@ -501,3 +576,39 @@ class AuxiliaryOutputsUpdate(StatusUpdate):
             timestamp=packet.timestamp,
             address=packet.address,
         )
+
+
+_EVENT_TYPE_MAP = {e.value: e for e in SystemStatusEvent.EventType}
+_REQUEST_ID_MAP = {e.value: e for e in StatusUpdate.RequestID}
+_REQUEST_ID_HEX_MAP = {e: format(e.value, "02x") for e in StatusUpdate.RequestID}
+_VIEW_STATE_MAP = {e.value: e for e in ViewStateUpdate.State}
+_MODEL_MAP = {e.value: e for e in PanelVersionUpdate.Model}
+
+_COMMAND_DECODER_MAP: Dict[CommandType, Callable[[Packet], BaseEvent]] = {
+    CommandType.SYSTEM_STATUS: SystemStatusEvent.decode,
+    CommandType.USER_INTERFACE: StatusUpdate.decode,
+}
+
+_REQUEST_ID_DECODER_MAP: Dict[
+    StatusUpdate.RequestID, Callable[[Packet], StatusUpdate]
+] = {
+    StatusUpdate.RequestID.ZONE_INPUT_UNSEALED: ZoneUpdate.decode,
+    StatusUpdate.RequestID.ZONE_RADIO_UNSEALED: ZoneUpdate.decode,
+    StatusUpdate.RequestID.ZONE_CBUS_UNSEALED: ZoneUpdate.decode,
+    StatusUpdate.RequestID.ZONE_IN_DELAY: ZoneUpdate.decode,
+    StatusUpdate.RequestID.ZONE_IN_DOUBLE_TRIGGER: ZoneUpdate.decode,
+    StatusUpdate.RequestID.ZONE_IN_ALARM: ZoneUpdate.decode,
+    StatusUpdate.RequestID.ZONE_EXCLUDED: ZoneUpdate.decode,
+    StatusUpdate.RequestID.ZONE_AUTO_EXCLUDED: ZoneUpdate.decode,
+    StatusUpdate.RequestID.ZONE_SUPERVISION_FAIL_PENDING: ZoneUpdate.decode,
+    StatusUpdate.RequestID.ZONE_SUPERVISION_FAIL: ZoneUpdate.decode,
+    StatusUpdate.RequestID.ZONE_DOORS_OPEN: ZoneUpdate.decode,
+    StatusUpdate.RequestID.ZONE_DETECTOR_LOW_BATTERY: ZoneUpdate.decode,
+    StatusUpdate.RequestID.ZONE_DETECTOR_TAMPER: ZoneUpdate.decode,
+    StatusUpdate.RequestID.MISCELLANEOUS_ALARMS: MiscellaneousAlarmsUpdate.decode,
+    StatusUpdate.RequestID.ARMING: ArmingUpdate.decode,
+    StatusUpdate.RequestID.OUTPUTS: OutputsUpdate.decode,
+    StatusUpdate.RequestID.VIEW_STATE: ViewStateUpdate.decode,
+    StatusUpdate.RequestID.PANEL_VERSION: PanelVersionUpdate.decode,
+    StatusUpdate.RequestID.AUXILIARY_OUTPUTS: AuxiliaryOutputsUpdate.decode,
+}
@@ -56,12 +56,11 @@ async def test_aux_off(connection, client):
 @pytest.mark.asyncio
 async def test_update(connection, client):
     await client.update()
-    assert connection.write.call_count == 2
-    commands = {
-        get_data(connection.write.call_args_list[0][0][0]),
-        get_data(connection.write.call_args_list[1][0][0]),
-    }
-    assert commands == {b"S00", b"S14"}
+    assert connection.write.call_count == 1
+    packets = connection.write.call_args[0][0].split(b"\r\n")
+    assert packets[-1] == b""
+    commands = [get_data(pkt + b"\r\n") for pkt in packets[:-1]]
+    assert commands == [b"S00", b"S14"]
 
 
 @pytest.mark.asyncio
@@ -86,6 +85,14 @@ async def test_send_command_2(connection, client):
     assert get_data(connection.write.call_args[0][0]) == b"FOOBARBAZ"
 
 
+@pytest.mark.asyncio
+async def test_send_command_skips_connect_when_connected(connection, client):
+    connection.connected = True
+    await client.send_command("A1234E")
+    assert connection.connect.call_count == 0
+    assert connection.write.call_count == 1
+
+
 def test_keepalive_bad_data_does_not_crash():
     # TODO(NW): Find a way to test this functionality inside the recv loop
     pass
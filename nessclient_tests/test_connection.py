@@ -0,0 +1,168 @@
+import asyncio
+import socket
+from unittest.mock import Mock
+
+import pytest
+
+from nessclient.connection import (
+    IP232Connection,
+    NessProtocol,
+    MAX_FRAME_SIZE,
+    MAX_QUEUED_BYTES,
+)
+
+
+@pytest.mark.asyncio
+async def test_protocol_splits_frames():
+    protocol = NessProtocol()
+    protocol.data_received(b"8700036100070018092118370974\r\n87000361")
+    protocol.data_received(b"00070018092118370974\r\n")
+    assert await protocol.read_frame() == b"8700036100070018092118370974"
+    assert await protocol.read_frame() == b"8700036100070018092118370974"
+
+
+@pytest.mark.asyncio
+async def test_protocol_buffers_partial_frame():
+    protocol = NessProtocol()
+    protocol.data_received(b"870003610007")
+    protocol.connection_lost(None)
+    assert await protocol.read_frame() is None
+
+
+@pytest.mark.asyncio
+async def test_protocol_drain_after_connection_lost_raises():
+    protocol = NessProtocol()
+    protocol.connection_lost(None)
+    with pytest.raises(ConnectionResetError):
+        await protocol.drain()
+
+
+@pytest.mark.asyncio
+async def test_ip232_connection_read_write():
+    received: asyncio.Queue[bytes] = asyncio.Queue()
+
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        received.put_nowait(await reader.readuntil(b"\n"))
+        writer.write(b"8700036100070018092118370974\r\n")
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, host="127.0.0.1", port=0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        connection = IP232Connection(host="127.0.0.1", port=port)
+        await connection.connect()
+        assert connection.connected
+        transport = connection._transport
+        await connection.connect()
+        assert connection._transport is transport
+        sock = connection._transport.get_extra_info("socket")
+        assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+
+        await connection.write(b"8300360S00E9\r\n")
+        assert await received.get() == b"8300360S00E9\r\n"
+        assert await connection.read() == b"8700036100070018092118370974"
+        assert await connection.read() is None
+        assert not connection.connected
+
+
+@pytest.mark.asyncio
+async def test_protocol_drain_wakes_all_waiters_on_resume():
+    protocol = NessProtocol()
+    protocol.pause_writing()
+    waiters = asyncio.gather(protocol.drain(), protocol.drain())
+    await asyncio.sleep(0)
+    assert not waiters.done()
+
+    protocol.resume_writing()
+    await waiters
+
+
+@pytest.mark.asyncio
+async def test_protocol_splits_multiple_frames_in_one_chunk():
+    protocol = NessProtocol()
+    protocol.data_received(b"first\r\nsecond\r\nthi")
+    protocol.data_received(b"rd\r\n")
+    assert await protocol.read_frame() == b"first"
+    assert await protocol.read_frame() == b"second"
+    assert await protocol.read_frame() == b"third"
+
+
+@pytest.mark.asyncio
+async def test_protocol_buffered_reads():
+    protocol = NessProtocol()
+    chunks = [b"first\r\nsec", b"ond\r\n", b"third\r\n"]
+    for chunk in chunks:
+        buf = protocol.get_buffer(-1)
+        buf[: len(chunk)] = chunk
+        protocol.buffer_updated(len(chunk))
+
+    assert await protocol.read_frame() == b"first"
+    assert await protocol.read_frame() == b"second"
+    assert await protocol.read_frame() == b"third"
+
+
+@pytest.mark.asyncio
+async def test_protocol_grows_buffer_for_long_frames():
+    protocol = NessProtocol()
+    frame = b"8" * 10000
+    protocol.data_received(frame[:3000])
+    protocol.data_received(frame[3000:] + b"\r\n")
+    assert await protocol.read_frame() == frame
+
+
+@pytest.mark.asyncio
+async def test_protocol_accepts_bare_newline_terminator():
+    protocol = NessProtocol()
+    protocol.data_received(b"first\nsecond\r\n\r\n")
+    assert await protocol.read_frame() == b"first"
+    assert await protocol.read_frame() == b"second"
+    assert await protocol.read_frame() == b""
+
+
+@pytest.mark.asyncio
+async def test_protocol_disables_write_buffering():
+    transport = Mock(asyncio.Transport)
+    NessProtocol().connection_made(transport)
+    transport.set_write_buffer_limits.assert_called_once_with(high=0)
+
+
+@pytest.mark.asyncio
+async def test_protocol_discards_oversized_partial_frame():
+    protocol = NessProtocol()
+    protocol.data_received(b"8" * (MAX_FRAME_SIZE + 1))
+    # The remainder of the oversized line is dropped, even across reads
+    protocol.data_received(b"888")
+    protocol.data_received(b"8\r\nnext\r\n")
+    assert await protocol.read_frame() == b"next"
+
+
+@pytest.mark.asyncio
+async def test_write_when_not_connected_raises():
+    connection = IP232Connection(host="127.0.0.1", port=0)
+    with pytest.raises(ConnectionError):
+        await connection.write(b"8300360S00E9\r\n")
+
+
+@pytest.mark.asyncio
+async def test_protocol_pauses_reading_until_frames_are_consumed():
+    transport = Mock(asyncio.Transport)
+    protocol = NessProtocol()
+    protocol.connection_made(transport)
+
+    frame = b"8700036100070018092118370974"
+    count = 0
+    while not transport.pause_reading.called:
+        protocol.data_received(frame + b"\r\n")
+        count += 1
+    assert count * (len(frame) + 1) > MAX_QUEUED_BYTES
+
+    # Reading resumes once the backlog has been drained below the limit
+    while not transport.resume_reading.called:
+        assert await protocol.read_frame() == frame
+        count -= 1
+    assert count * (len(frame) + 1) <= MAX_FRAME_SIZE
+    transport.pause_reading.assert_called_once_with()
+    transport.resume_reading.assert_called_once_with()
@@ -41,6 +41,35 @@ class BaseEventTestCase(unittest.TestCase):
         pkt = make_packet(cast(CommandType, 0x01), "000000")
         self.assertRaises(ValueError, lambda: BaseEvent.decode(pkt))
 
+    def test_repr(self):
+        event = SystemStatusEvent(
+            type=SystemStatusEvent.EventType.ALARM,
+            zone=1,
+            area=2,
+            address=None,
+            timestamp=None,
+        )
+        self.assertEqual(
+            repr(event),
+            "<SystemStatusEvent {'address': None, 'timestamp': None, "
+            "'type': <EventType.ALARM: 2>, 'zone': 1, 'area': 2}>",
+        )
+
+    def test_repr_partially_constructed(self):
+        event = SystemStatusEvent.__new__(SystemStatusEvent)
+        self.assertEqual(repr(event), "<SystemStatusEvent {}>")
+
+    def test_repr_includes_subclass_attributes(self):
+        class CustomEvent(BaseEvent):
+            def __init__(self):
+                super().__init__(address=None, timestamp=None)
+                self.custom = 1
+
+        self.assertEqual(
+            repr(CustomEvent()),
+            "<CustomEvent {'address': None, 'timestamp': None, 'custom': 1}>",
+        )
+
 
 class StatusUpdateTestCase(unittest.TestCase):
     def test_decode_zone_update(self):
@@ -82,6 +111,17 @@ class StatusUpdateTestCase(unittest.TestCase):
         pkt = make_packet(CommandType.USER_INTERFACE, "550000")
         self.assertRaises(ValueError, lambda: StatusUpdate.decode(pkt))
 
+    def test_decode_every_zone_request_id(self):
+        for request_id in StatusUpdate.RequestID:
+            if not request_id.name.startswith("ZONE"):
+                continue
+            pkt = make_packet(
+                CommandType.USER_INTERFACE, "{:02x}0000".format(request_id.value)
+            )
+            event = StatusUpdate.decode(pkt)
+            self.assertTrue(isinstance(event, ZoneUpdate))
+            self.assertEqual(event.request_id, request_id)
+
 
 class ArmingUpdateTestCase(unittest.TestCase):
     def test_encode(self):
@@ -108,6 +148,15 @@ class ArmingUpdateTestCase(unittest.TestCase):
 
 
 class ZoneUpdateTestCase(unittest.TestCase):
+    def test_decode_negative_bitfield_raises(self):
+        pkt = make_packet(CommandType.USER_INTERFACE, "00-001")
+        self.assertRaises(ValueError, lambda: ZoneUpdate.decode(pkt))
+
+    def test_decode_malformed_bitfield_raises(self):
+        for data in ["0001", "00 1 ", "000_1", "00+001"]:
+            pkt = make_packet(CommandType.USER_INTERFACE, data)
+            self.assertRaises(ValueError, lambda: ZoneUpdate.decode(pkt))
+
     def test_encode(self):
         event = ZoneUpdate(
             included_zones=[ZoneUpdate.Zone.ZONE_1, ZoneUpdate.Zone.ZONE_3],
@@ -142,6 +191,14 @@ class ZoneUpdateTestCase(unittest.TestCase):
             event.included_zones, [ZoneUpdate.Zone.ZONE_3, ZoneUpdate.Zone.ZONE_5]
         )
 
+    def test_zone_input_unsealed_across_bytes(self):
+        pkt = make_packet(CommandType.USER_INTERFACE, "000181")
+        event = ZoneUpdate.decode(pkt)
+        self.assertEqual(
+            event.included_zones,
+            [ZoneUpdate.Zone.ZONE_1, ZoneUpdate.Zone.ZONE_9, ZoneUpdate.Zone.ZONE_16],
+        )
+
 
 class ViewStateUpdateTestCase(unittest.TestCase):
     def test_normal_state(self):
@@ -149,6 +206,13 @@ class ViewStateUpdateTestCase(unittest.TestCase):
         event = ViewStateUpdate.decode(pkt)
         self.assertEqual(event.state, ViewStateUpdate.State.NORMAL)
 
+    def test_unknown_state(self):
+        pkt = make_packet(CommandType.USER_INTERFACE, "161234")
+        with self.assertRaisesRegex(
+            ValueError, "4660 is not a valid ViewStateUpdate.State"
+        ):
+            ViewStateUpdate.decode(pkt)
+
 
 class OutputsUpdateTestCase(unittest.TestCase):
     def test_panic_outputs(self):
@@ -194,6 +258,10 @@ class MiscellaneousAlarmsUpdateTestCase(unittest.TestCase):
 
 
 class SystemStatusEventTestCase(unittest.TestCase):
+    def test_decode_short_data_raises(self):
+        pkt = make_packet(CommandType.SYSTEM_STATUS, "0001")
+        self.assertRaises(ValueError, lambda: SystemStatusEvent.decode(pkt))
+
     def test_exit_delay_end(self):
         pkt = make_packet(CommandType.SYSTEM_STATUS, "230001")
         event = SystemStatusEvent.decode(pkt)
@@ -224,6 +292,10 @@ class SystemStatusEventTestCase(unittest.TestCase):
 
 
 class PanelVersionUpdateTestCase(unittest.TestCase):
+    def test_decode_short_data_raises(self):
+        pkt = make_packet(CommandType.USER_INTERFACE, "1704")
+        self.assertRaises(ValueError, lambda: PanelVersionUpdate.decode(pkt))
+
     def test_model(self):
         pkt = make_packet(CommandType.USER_INTERFACE, "160000")
         event = PanelVersionUpdate.decode(pkt)
@@ -8,7 +8,7 @@ class SerialTransport(asyncio.Transport):
     def __init__(
         self,
         loop: asyncio.AbstractEventLoop,
-        protocol: asyncio.Protocol,
+        protocol: asyncio.BaseProtocol,
         serial_instance: serial.Serial,
     ): ...
     @property
@@ -32,8 +32,8 @@ class SerialTransport(asyncio.Transport):
 
 async def create_serial_connection(
     loop: asyncio.AbstractEventLoop,
-    protocol_factory: Callable[[], asyncio.Protocol],
+    protocol_factory: Callable[[], asyncio.BaseProtocol],
     url: str,
     *args: _P.args,
     **kwargs: _P.kwargs
-) -> Tuple[SerialTransport, asyncio.Protocol]: ...
+) -> Tuple[SerialTransport, asyncio.BaseProtocol]: ...